@@ -10,6 +10,38 @@ adoption form and receive personalized pet recommendations.
 import streamlit as st
 
 
+# Define the pages of the web application
+PAGES = [
+    st.Page(
+        "./pages/home.py",
+        title="Inicio",
+        icon="🏠",
+        default=True,
+    ),
+    st.Page(
+        "./pages/recommendation-form.py",
+        title="Formulario de recomendación",
+        icon="🐶",
+    ),
+    st.Page(
+        "./pages/catalog.py",
+        title="Catálogo de adopción",
+        icon="🐾",
+        url_path="catalog",
+    ),
+    st.Page(
+        "./pages/eda.py",
+        title="Análisis exploratorio de datos",
+        icon="📊",
+    ),
+    st.Page(
+        "./pages/feedback-form.py",
+        title="Danos tu opinión!",
+        icon="✍️",
+    ),
+]
+
+
 def main():
     """Main function to run the pet adoption recommendation web application."""
     # Set the page configuration
@@ -18,38 +50,10 @@ def main():
         initial_sidebar_state="auto",
     )
 
-    # Set up the Streamlit page configuration
+    # Set up the Streamlit page navigation
     pg = st.navigation(
         position="top",
-        pages=[
-            st.Page(
-                "./pages/home.py",
-                title="Inicio",
-                icon="🏠",
-                default=True,
-            ),
-            st.Page(
-                "./pages/recommendation-form.py",
-                title="Formulario de recomendación",
-                icon="🐶",
-            ),
-            st.Page(
-                "./pages/catalog.py",
-                title="Catálogo de adopción",
-                icon="🐾",
-                url_path="catalog",
-            ),
-            st.Page(
-                "./pages/eda.py",
-                title="Análisis exploratorio de datos",
-                icon="📊",
-            ),
-            st.Page(
-                "./pages/feedback-form.py",
-                title="Danos tu opinión!",
-                icon="✍️",
-            ),
-        ],
+        pages=PAGES,
     )
     pg.run()
 
@@ -7,21 +7,33 @@ currently available dogs for adoption with a resume of each dog's information, a
 and a link to the dog's original page on the Kiwoko website.
 """
 
+from html import escape
 from itertools import batched
-from pathlib import Path
 
+import numpy as np
 import streamlit as st
 
 try:
-    from src.ml_models import load_dataset
+    from src.ml_models import get_clean_dogs_df
 except ImportError:
-    from ..src.ml_models import load_dataset
+    from ..src.ml_models import get_clean_dogs_df
 
 
 # Define visualization constants
 ELEMENTS_PER_ROW = 3
 ELEMENTS_PER_PAGE = 6
 
+# Compatibility emojis for every combination of the "good with children", "good with
+# dogs" and "good with cats" features, indexed by their bits in that order
+COMPATIBILITY_EMOJIS = tuple(
+    " ".join(
+        emoji
+        for emoji, bit in zip(("👶", "🐶", "🐱"), (0b100, 0b010, 0b001))
+        if compatibility_mask & bit
+    )
+    for compatibility_mask in range(0b1000)
+)
+
 
 def main():
     """Main function to run the pet adoption catalog page of the web application."""
@@ -37,40 +49,17 @@ def init_session_state_variables():
 
     # Load the dogs dataset
     if "dogs_df" not in st.session_state:
-        st.session_state.dogs_df = (
-            load_dataset(Path("./data/kiwoko_dogs_data-2025-06-27_12-56-43.csv"))
-            .dropna(
-                subset=[
-                    "size",
-                    "img_url",
-                ]
-            )
-            .drop(
-                index=[
-                    2023,
-                    8706,
-                    11011,
-                    11221,
-                    11334,
-                    12385,
-                    12541,
-                    12780,
-                    13156,
-                    13377,
-                    13378,
-                ],
-                errors="ignore",
-            )
-        )
+        st.session_state.dogs_df = get_clean_dogs_df()
 
-    # Create an iterator for the dataset to ease the display of dogs in batches
-    if "dataset_shuffled_indexes" not in st.session_state:
-        st.session_state.dataset_shuffled_indexes = st.session_state.dogs_df.sample(
-            frac=1,
-        ).index
+    # Shuffle the positions of the dataset rows to ease the display of dogs in batches
+    if "dataset_shuffled_positions" not in st.session_state:
+        st.session_state.dataset_shuffled_positions = (
+            np.random.default_rng().permutation(len(st.session_state.dogs_df))
+        )
 
-    if "dataset_iterator_index" not in st.session_state:
-        st.session_state.dataset_iterator_index = 0
+    # Start the catalog at its first page
+    if "catalog_page_index" not in st.session_state:
+        st.session_state.catalog_page_index = 0
 
 
 def show_title_and_description():
@@ -86,41 +75,45 @@ def show_title_and_description():
 def show_catalog():
     """Display the catalog of dogs available for adoption in batches of three."""
 
-    for current_dogs_ids_batch in batched(
-        st.session_state.dataset_shuffled_indexes[
-            st.session_state.dataset_iterator_index : (
-                st.session_state.dataset_iterator_index + ELEMENTS_PER_PAGE
-            )
-        ],
+    number_of_pages = (
+        len(st.session_state.dataset_shuffled_positions) + ELEMENTS_PER_PAGE - 1
+    ) // ELEMENTS_PER_PAGE
+    current_page_start = st.session_state.catalog_page_index * ELEMENTS_PER_PAGE
+
+    # Gather all the dogs of the current page at once by their positions
+    current_page_dogs_df = st.session_state.dogs_df.iloc[
+        st.session_state.dataset_shuffled_positions[
+            current_page_start : current_page_start + ELEMENTS_PER_PAGE
+        ]
+    ]
+
+    for current_dogs_batch in batched(
+        current_page_dogs_df.itertuples(index=False, name="Dog"),
         ELEMENTS_PER_ROW,
     ):
-        for current_column, current_dog_id in zip(
+        for current_column, current_dog in zip(
             st.columns(ELEMENTS_PER_ROW, border=True),
-            current_dogs_ids_batch,
+            current_dogs_batch,
         ):
             with current_column:
-                display_dog_info(st.session_state.dogs_df.loc[current_dog_id])
+                display_dog_info(current_dog)
 
     left_column, center_column, right_column = st.columns(3)
     with left_column:
         st.button(
             "Anterior",
             use_container_width=True,
-            disabled=st.session_state.dataset_iterator_index <= 0,
+            disabled=st.session_state.catalog_page_index <= 0,
             on_click=lambda: st.session_state.update(
-                dataset_iterator_index=st.session_state.dataset_iterator_index
-                - ELEMENTS_PER_PAGE
+                catalog_page_index=st.session_state.catalog_page_index - 1
             ),
         )
     with center_column:
         st.markdown(
             '<div style="text-align: center;">Página '
-            + str(st.session_state.dataset_iterator_index // ELEMENTS_PER_PAGE + 1)
+            + str(st.session_state.catalog_page_index + 1)
             + " de "
-            + str(
-                (len(st.session_state.dataset_shuffled_indexes) + ELEMENTS_PER_PAGE - 1)
-                // ELEMENTS_PER_PAGE
-            )
+            + str(number_of_pages)
             + "</div>",
             unsafe_allow_html=True,
         )
@@ -128,52 +121,49 @@ def show_catalog():
         st.button(
             "Siguiente",
             use_container_width=True,
-            disabled=(
-                st.session_state.dataset_iterator_index + ELEMENTS_PER_PAGE
-                >= len(st.session_state.dataset_shuffled_indexes)
-            ),
+            disabled=st.session_state.catalog_page_index >= number_of_pages - 1,
             on_click=lambda: st.session_state.update(
-                dataset_iterator_index=st.session_state.dataset_iterator_index
-                + ELEMENTS_PER_PAGE
+                catalog_page_index=st.session_state.catalog_page_index + 1
             ),
         )
 
 
 def display_dog_info(dog):
-    """Display information about a dog in the catalog."""
-
-    left_column, right_column = st.columns(2)
-
-    with left_column:
-        st.image(
-            dog["img_url"],
-            use_container_width=True,
-            caption="Unavailable image" if dog["img_url"] is None else "",
-        )
-
-    with right_column:
-        st.link_button(
-            label=f"**{dog["name"]}**",
-            url=dog["info_url"],
-        )
-
-        st.write(f"**Edad:** {dog["age"]} años")
-        st.write(f"**Tamaño:** {dog["size"]}")
-        st.write(f"**Provincia:** {dog["province"]}")
-        st.write(f"**Puede viajar:** {"Sí" if dog["can_travel"] else "No"}")
-
-        emojis = []
-        if dog["good_with_children"]:
-            emojis.append("👶")
-        if dog["good_with_dogs"]:
-            emojis.append("🐶")
-        if dog["good_with_cats"]:
-            emojis.append("🐱")
-
-        if len(emojis) > 0:
-            st.write(" ".join(emojis))
-
-        st.write(" 🔴 ¡Urge adopción! 🔴" if dog["urgent_adoption"] else "")
+    """
+    Display information about a dog in the catalog, given as a named tuple with the
+    features of the dataset as attributes.
+    """
+
+    dog_details = [
+        f'<a href="{escape(dog.info_url)}" target="_blank"><b>{escape(dog.name)}</b></a>',
+        f"<b>Edad:</b> {dog.age} años",
+        f"<b>Tamaño:</b> {escape(dog.size)}",
+        f"<b>Provincia:</b> {escape(dog.province)}",
+        f"<b>Puede viajar:</b> {"Sí" if dog.can_travel else "No"}",
+        COMPATIBILITY_EMOJIS[
+            (dog.good_with_children << 2)
+            | (dog.good_with_dogs << 1)
+            | dog.good_with_cats
+        ],
+        "🔴 ¡Urge adopción! 🔴" if dog.urgent_adoption else "",
+    ]
+
+    # Render the whole card as a single element with the image and the details side by
+    # side, letting the browser defer the download and decoding of the image into a
+    # fixed square box, so the layout does not shift when it arrives
+    st.markdown(
+        '<div style="display: flex; gap: 1rem;">'
+        + '<div style="flex: 1;">'
+        + f'<img src="{escape(dog.img_url)}" loading="lazy" decoding="async"'
+        + ' style="width: 100%; aspect-ratio: 1; object-fit: contain;"'
+        + ' alt="Unavailable image">'
+        + "</div>"
+        + '<div style="flex: 1;">'
+        + "".join(f"<p>{detail}</p>" for detail in dog_details if detail)
+        + "</div>"
+        + "</div>",
+        unsafe_allow_html=True,
+    )
 
 
 if __name__ == "__main__":
@@ -7,29 +7,89 @@ application to display various visualizations and insights about the available p
 for adoption.
 """
 
+from io import BytesIO
 from pathlib import Path
 
+import altair as alt
 import geopandas as gpd
+import matplotlib
+
+# Use the non-interactive backend, figures are only rendered to images
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import seaborn as sns
 import streamlit as st
 
 
 try:
-    from src.ml_models import load_dataset
+    from src.ml_models import get_clean_dogs_df
     from src.encodings import (
         PET_GENDER_ENCODING,
         PET_SIZE_ENCODING,
     )
 except ImportError:
-    from ..src.ml_models import load_dataset
+    from ..src.ml_models import get_clean_dogs_df
     from ..src.encodings import (
         PET_GENDER_ENCODING,
         PET_SIZE_ENCODING,
     )
 
 
+# Define the source of the map of the Spanish provinces
+SPAIN_GEOJSON_URL = "https://raw.githubusercontent.com/codeforamerica/click_that_hood/master/public/data/spain-provinces.geojson"
+
+# Define visualization constants
+GENDER_PALETTE = sns.color_palette("Pastel1", n_colors=2)
+
+# Define the features of the dataset by type, in the same order as in the dataset
+NUMERICAL_FEATURES = [
+    "age",
+]
+BOOLEAN_FEATURES = [
+    "can_travel",
+    "urgent_adoption",
+    "needs_vet_care",
+    "is_vaccinated",
+    "is_dewormed",
+    "is_healthy",
+    "is_sterilized",
+    "is_identified",
+    "has_microchip",
+    "has_passport",
+    "good_with_children",
+    "good_with_cats",
+    "good_with_dogs",
+    "is_affectionate",
+    "is_hyperactive",
+    "is_fearful",
+    "is_sociable",
+    "is_calm",
+    "is_sedentary",
+]
+
+# Define the features shown together in the EDA histograms
+HEALTH_AND_CARE_FEATURES = [
+    "is_healthy",
+    "is_vaccinated",
+    "is_dewormed",
+    "is_sterilized",
+    "is_identified",
+    "has_microchip",
+    "has_passport",
+]
+PERSONALITY_AND_BEHAVIOR_FEATURES = [
+    "is_affectionate",
+    "is_hyperactive",
+    "is_fearful",
+    "is_sociable",
+    "is_calm",
+    "is_sedentary",
+]
+
+
 def main():
     """Main function to run the EDA page of the web application."""
 
@@ -71,62 +131,69 @@ def init_session_state_variables():
 
     # Load the dogs dataset
     if "dogs_df" not in st.session_state:
-        st.session_state.dogs_df = (
-            load_dataset(Path("./data/kiwoko_dogs_data-2025-06-27_12-56-43.csv"))
-            .dropna(
-                subset=[
-                    "size",
-                    "img_url",
-                ]
-            )
-            .drop(
-                index=[
-                    2023,
-                    8706,
-                    11011,
-                    11221,
-                    11334,
-                    12385,
-                    12541,
-                    12780,
-                    13156,
-                    13377,
-                    13378,
-                ],
-                errors="ignore",
-            )
-        )
+        st.session_state.dogs_df = get_clean_dogs_df()
 
     # Prepare the dataset for visualization
     if "visualization_df" not in st.session_state:
-        st.session_state.visualization_df = encode_dataset(st.session_state.dogs_df)
+        st.session_state.visualization_df = get_visualization_df()
+
+    # Precompute the statistics of the features shown in the histograms
+    if "health_and_care_stats" not in st.session_state:
+        st.session_state.health_and_care_stats = get_stats(
+            st.session_state.dogs_df, HEALTH_AND_CARE_FEATURES
+        )
+    if "personality_and_behavior_stats" not in st.session_state:
+        st.session_state.personality_and_behavior_stats = get_stats(
+            st.session_state.dogs_df, PERSONALITY_AND_BEHAVIOR_FEATURES
+        )
 
     if "gdf" not in st.session_state:
         # Load the world map for visualization
-        st.session_state.gdf = gpd.read_file(
-            "https://raw.githubusercontent.com/codeforamerica/click_that_hood/master/public/data/spain-provinces.geojson"
-        )
+        st.session_state.gdf = load_spain_geojson()
+
+
+@st.cache_resource(show_spinner=False)
+def load_spain_geojson():
+    """
+    Load the map of the Spanish provinces, shared across sessions so it is only
+    downloaded once per process.
+    """
+
+    return gpd.read_file(SPAIN_GEOJSON_URL, engine="pyogrio")
+
+
+@st.cache_data(show_spinner=False)
+def get_visualization_df():
+    """
+    Get the encoded dataset for visualization purposes, shared across sessions so it is
+    only encoded once per process.
+    """
+
+    return encode_dataset(get_clean_dogs_df())
 
 
 def encode_dataset(dogs_df):
     """Encode categorical variables in the dataset for visualization purposes."""
 
-    dogs_encoded_df = dogs_df.drop(
-        columns=[
-            "name",
-            "breed",
-            "description_1",
-            "description_2",
-            "img_url",
-            "info_url",
-        ]
-    ).select_dtypes(include="number")
+    dogs_encoded_df = dogs_df[NUMERICAL_FEATURES]
 
-    dogs_encoded_df["is_male"] = dogs_df["gender"].map(PET_GENDER_ENCODING).astype(int)
-    dogs_encoded_df["size"] = dogs_df["size"].map(PET_SIZE_ENCODING).astype(int)
+    # The encodings map each category to its position, so they are the categorical codes
+    dogs_encoded_df = dogs_encoded_df.assign(
+        is_male=pd.Categorical(
+            dogs_df["gender"], categories=list(PET_GENDER_ENCODING)
+        ).codes,
+        size=pd.Categorical(dogs_df["size"], categories=list(PET_SIZE_ENCODING)).codes,
+    )
 
-    for feature in dogs_df.select_dtypes(include="boolean").columns:
-        dogs_encoded_df[feature] = dogs_df[feature].astype(int)
+    # Convert the whole block of boolean features at once
+    dogs_encoded_df = pd.concat(
+        [
+            dogs_encoded_df,
+            dogs_df[BOOLEAN_FEATURES].astype(np.int8),
+        ],
+        axis=1,
+        copy=False,
+    )
 
     return dogs_encoded_df
 
@@ -160,24 +227,33 @@ def show_age_size_gender_boxplot():
 
     st.subheader("Distribución de edades según el tamaño y el género")
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+    st.image(
+        render_age_size_gender_boxplot(st.session_state.dogs_df),
+        use_container_width=True,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_age_size_gender_boxplot(_dogs_df):
+    """Render the boxplot of pet ages by size and gender as a PNG image."""
+
+    fig, ax = plt.subplots(figsize=(8, 6), layout="constrained")
     sns.boxplot(
         x="size",
         y="age",
         hue="gender",
         hue_order=["Hembra", "Macho"],
         order=["Enano", "Pequeño", "Mediano", "Grande", "Gigante"],
-        palette=sns.color_palette("Pastel1", n_colors=2),
-        data=st.session_state.dogs_df.loc[(st.session_state.dogs_df["age"] < 50)],
+        palette=GENDER_PALETTE,
+        data=_dogs_df.loc[(_dogs_df["age"] < 50)],
         ax=ax,
     )
 
-    plt.legend(title="Género", loc="upper right")
+    ax.legend(title="Género", loc="upper right")
     ax.set_xlabel("Tamaño")
     ax.set_ylabel("Edad")
 
-    plt.tight_layout()
-    st.pyplot(fig)
+    return figure_to_png(fig)
 
 
 def show_choropleth_map():
@@ -185,20 +261,19 @@ def show_choropleth_map():
 
     st.subheader("Mapa de disponibilidad por provincia")
 
-    fig, ax = plt.subplots(figsize=(10, 10))
-
-    dogs_per_province = (
-        st.session_state.dogs_df.groupby("province", observed=True)
-        .size()
-        .reset_index(name="num_dogs_available")
+    st.image(
+        render_choropleth_map(st.session_state.dogs_df, st.session_state.gdf),
+        use_container_width=True,
     )
-    gdf = st.session_state.gdf.merge(
-        dogs_per_province,
-        left_on="name",
-        right_on="province",
-        how="left",
-    )
-    gdf["num_dogs_available"] = gdf["num_dogs_available"].fillna(0)
+
+
+@st.cache_data(show_spinner=False)
+def render_choropleth_map(_dogs_df, _gdf):
+    """Render the choropleth map of available dogs by province as a PNG image."""
+
+    fig, ax = plt.subplots(figsize=(10, 10), layout="constrained")
+
+    gdf = build_choropleth_gdf(_dogs_df, _gdf)
 
     gdf.plot(
         column="num_dogs_available",
@@ -213,9 +288,29 @@ def show_choropleth_map():
         },
     )
 
-    plt.axis("off")
+    ax.axis("off")
+
+    return figure_to_png(fig)
 
-    st.pyplot(fig)
+
+@st.cache_data(show_spinner=False)
+def build_choropleth_gdf(_dogs_df, _gdf):
+    """
+    Get the map of the Spanish provinces with the number of available dogs in each one.
+
+    The arguments are not hashed by Streamlit (leading underscore) since both the dogs
+    dataset and the map are fixed for the whole process, so the result is computed only
+    once.
+    """
+
+    # Look up the number of dogs of each province by its name, without mutating the
+    # shared map
+    return _gdf.assign(
+        num_dogs_available=_gdf["name"]
+        .map(_dogs_df["province"].value_counts())
+        .fillna(0)
+        .astype(np.int32)
+    )
 
 
 def show_health_and_care_histograms():
@@ -223,93 +318,66 @@ def show_health_and_care_histograms():
 
     st.subheader("Distribución de características de salud y cuidado")
 
-    health_and_care_features = [
-        "is_healthy",
-        "is_vaccinated",
-        "is_dewormed",
-        "is_sterilized",
-        "is_identified",
-        "has_microchip",
-        "has_passport",
-    ]
-    health_and_care_stats = get_stats(health_and_care_features)
-
-    fig, ax = plt.subplots(figsize=(8, 6))
-
-    # Create a bar plot to visualize the distribution of health and care features
-    sns.barplot(
-        ax=ax,
-        data=health_and_care_stats,
-        x="value",
-        y="count",
-        hue="variable",
-        palette="pastel",
-        order=["True", "False"],  # Ensure the order of the bars is consistent
+    show_features_bar_chart(
+        st.session_state.health_and_care_stats,
+        x_label="Características de salud y cuidado",
     )
 
-    ax.legend(title="Características", loc="upper right")
-    ax.set_xlabel("Características de salud y cuidado")
-    ax.set_ylabel("Número de perros")
-
-    plt.tight_layout()
-    st.pyplot(fig)
-
 
 def show_personality_and_behavior_histograms():
     """Display histograms of personality and behavior features in the dataset"""
 
     st.subheader("Distribución de características de personalidad y comportamiento")
 
-    personality_and_behavior_features = [
-        "is_affectionate",
-        "is_hyperactive",
-        "is_fearful",
-        "is_sociable",
-        "is_calm",
-        "is_sedentary",
-    ]
-    personality_and_behavior_stats = get_stats(personality_and_behavior_features)
+    show_features_bar_chart(
+        st.session_state.personality_and_behavior_stats,
+        x_label="Características de personalidad y comportamiento",
+    )
 
-    fig, ax = plt.subplots(figsize=(8, 6))
 
-    # Create a bar plot to visualize the distribution of health and care features
-    sns.barplot(
-        ax=ax,
-        data=personality_and_behavior_stats,
-        x="value",
-        y="count",
-        hue="variable",
-        palette="pastel",
-        order=["True", "False"],  # Ensure the order of the bars is consistent
+def show_features_bar_chart(features_stats, x_label):
+    """
+    Display a bar chart with the number of dogs for each value of the given boolean
+    features, rendered by the browser.
+    """
+
+    chart = (
+        alt.Chart(features_stats.assign(value=features_stats["value"].astype(str)))
+        .mark_bar()
+        .encode(
+            # Ensure the order of the bars is consistent
+            x=alt.X("value:N", sort=["True", "False"], title=x_label),
+            xOffset=alt.XOffset("variable:N"),
+            y=alt.Y("count:Q", title="Número de perros"),
+            color=alt.Color(
+                "variable:N",
+                scale=alt.Scale(scheme="pastel1"),
+                title="Características",
+            ),
+        )
     )
 
-    ax.legend(title="Características", loc="upper left")
-    ax.set_xlabel("Características de personalidad y comportamiento")
-    ax.set_ylabel("Número de perros")
+    st.altair_chart(chart, use_container_width=True)
 
-    plt.tight_layout()
-    st.pyplot(fig)
 
+def get_stats(dogs_df, features):
+    """Get statistics for the specified boolean features in the dataset."""
 
-def get_stats(features):
-    """Get statistics for the specified features in the dataset."""
+    # Count the true values of every feature with a single reduction, the rest are false
+    true_counts = dogs_df[features].sum().to_numpy()
+    false_counts = len(dogs_df) - true_counts
 
-    return (
-        st.session_state.dogs_df[features]
-        .melt(
-            value_vars=features,
-        )
-        .groupby(
-            ["value", "variable"],
-            group_keys=True,
-            observed=True,
-        )
-        .size()
-        .reset_index(name="count")
-        .sort_values(
-            by=["value", "variable"],
-            ascending=[False, False],
-        )
+    features_stats = pd.DataFrame(
+        {
+            "value": [True] * len(features) + [False] * len(features),
+            "variable": features * 2,
+            "count": np.concatenate([true_counts, false_counts]),
+        }
+    )
+
+    return features_stats.loc[features_stats["count"] > 0].sort_values(
+        by=["value", "variable"],
+        ascending=[False, False],
     )
 
 
@@ -318,26 +386,77 @@ def show_correlation_heatmap():
 
     st.subheader("Mapa de correlación entre algunas de las características")
 
-    features_correlations = st.session_state.visualization_df.corr()
+    st.image(
+        render_correlation_heatmap(st.session_state.visualization_df),
+        use_container_width=True,
+    )
 
-    fig, ax = plt.subplots(figsize=(10, 10))
 
-    sns.heatmap(
-        features_correlations,
-        ax=ax,
-        mask=np.triu(np.ones_like(features_correlations, dtype=bool)),
-        annot=False,
-        fmt=".2f",
+@st.cache_data(show_spinner=False)
+def render_correlation_heatmap(_visualization_df):
+    """Render the correlation heatmap of the encoded dataset as a PNG image."""
+
+    features_correlations, upper_triangle_mask = compute_correlations(_visualization_df)
+
+    fig, ax = plt.subplots(figsize=(10, 10), layout="constrained")
+
+    # Draw the lower triangle of the correlation matrix as a single image
+    correlations_image = ax.imshow(
+        np.where(upper_triangle_mask, np.nan, features_correlations.to_numpy()),
         cmap="coolwarm",
-        square=True,
-        cbar_kws={"shrink": 0.8},
         vmin=-1,
         vmax=1,
-        linewidths=0.5,
     )
+    fig.colorbar(correlations_image, ax=ax, shrink=0.8)
+
+    ax.set_xticks(
+        range(len(features_correlations.columns)),
+        labels=features_correlations.columns,
+        rotation=90,
+    )
+    ax.set_yticks(
+        range(len(features_correlations.index)),
+        labels=features_correlations.index,
+    )
+    ax.spines[:].set_visible(False)
+
+    return figure_to_png(fig)
+
+
+@st.cache_data(show_spinner=False)
+def compute_correlations(_visualization_df):
+    """
+    Get the correlation matrix of the encoded dataset along with the mask of its upper
+    triangle, computed only once per process since the dataset is fixed.
+    """
+
+    # Pearson correlation as a single matrix product of the centered and normalized
+    # features, in single precision
+    features_matrix = _visualization_df.to_numpy(dtype=np.float32, copy=True)
+    features_matrix -= features_matrix.mean(axis=0)
+    features_matrix /= np.linalg.norm(features_matrix, axis=0)
+
+    features_correlations = pd.DataFrame(
+        features_matrix.T @ features_matrix,
+        index=_visualization_df.columns,
+        columns=_visualization_df.columns,
+    )
+    upper_triangle_mask = np.triu(np.ones_like(features_correlations, dtype=bool))
+
+    return features_correlations, upper_triangle_mask
+
+
+def figure_to_png(fig):
+    """
+    Render a matplotlib figure as PNG bytes, with the same settings used by
+    `st.pyplot`, and release it.
+    """
+
+    png_buffer = BytesIO()
+    fig.savefig(png_buffer, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
 
-    plt.tight_layout()
-    st.pyplot(fig)
+    return png_buffer.getvalue()
 
 
 if __name__ == "__main__":
@@ -27,8 +27,12 @@ def set_streamlit_page_config():
     )
 
 
+@st.fragment
 def show_feedback_form_section():
-    """Display the feedback form section of the page."""
+    """
+    Display the feedback form section of the page, as a fragment so that its reruns do
+    not re-execute the rest of the page.
+    """
 
     st.title("Cuestionario de retroalimentación")
 
@@ -7,6 +7,8 @@ application, the logic to generate personalized pet recommendations based on use
 and the display of the most suitable pets for adoption.
 """
 
+from html import escape
+
 import streamlit as st
 
 
@@ -28,6 +30,65 @@ except ImportError:
     )
 
 
+# Precompute the label, option names and option values of each form question
+QUESTIONS_CHOICES = tuple(
+    (question.question, tuple(question.options), question.options)
+    for question in QUESTIONS
+)
+
+# Texts displayed for the boolean features of the recommended pets, when the feature is
+# true and when it is false, where None means that nothing is displayed
+HEALTH_AND_CARE_TEXTS = {
+    "needs_vet_care": (
+        "🩺 Necesita cuidados veterinarios",
+        "🩺 No necesita cuidados veterinarios especiales",
+    ),
+    "is_healthy": ("💚 Está sano", None),
+    "is_vaccinated": ("💉 Está vacunado", "💉 No está vacunado"),
+    "is_dewormed": ("🪱 Está desparasitado", "🪱 No está desparasitado"),
+    "is_sterilized": ("✂️ Está esterilizado", "✂️ No está esterilizado"),
+    "is_identified": ("🪪 Está identificado", "🪪 No está identificado"),
+    "has_microchip": ("📌 Tiene microchip", "📌 No tiene microchip"),
+    "has_passport": ("🛂 Tiene pasaporte", "🛂 No tiene pasaporte"),
+}
+COMPATIBILITIES_TEXTS = {
+    "good_with_children": ("👶 Compatible con niños", "👶 No es compatible con niños"),
+    "good_with_cats": ("🐱 Compatible con gatos", "🐱 No es compatible con gatos"),
+    "good_with_dogs": ("🐶 Compatible con perros", "🐶 No es compatible con perros"),
+}
+PERSONALITY_TEXTS = {
+    "is_affectionate": ("❤️ Cariñoso", None),
+    "is_hyperactive": ("⚡ Hiperactivo", None),
+    "is_fearful": ("😨 Miedoso", None),
+    "is_sociable": ("👥 Sociable", None),
+    "is_calm": ("🛏️ Tranquilo", None),
+    "is_sedentary": ("🐢 Sedentario", None),
+}
+
+# Initial values of the session state variables of this page, the sequences are tuples
+# so that their single instance can be safely shared by every session
+SESSION_STATE_DEFAULTS = {
+    # Client answers list
+    "client_answers": (),
+    # Terms and conditions, privacy policy and form submission states
+    "terms_and_conditions": False,
+    "privacy_policy": False,
+    "form_submitted": False,
+    # Pet recommendations results and the texts to display for each of them
+    "pet_recommendations": (),
+    "pet_recommendations_texts": (),
+    # Client answers the pet recommendations were computed for
+    "recommended_client_answers": None,
+    # Initial pet ID
+    "current_pet_id": 0,
+    # Default number of recommendations
+    "number_of_recommendations": 10,
+    # Initial state of the navigation buttons
+    "next_recommendation": False,
+    "previous_recommendation": False,
+}
+
+
 def main():
     """Define the client view of the web-app, including the adoption form."""
 
@@ -54,35 +115,8 @@ def set_streamlit_page_config():
 def init_session_state_variables():
     """Initialize session state variables for the recommendation form page."""
 
-    # Initialize the client answers list
-    if "client_answers" not in st.session_state:
-        st.session_state.client_answers = []
-
-    # Initialize the terms and conditions, privacy policy and form submission states
-    if "terms_and_conditions" not in st.session_state:
-        st.session_state.terms_and_conditions = False
-    if "privacy_policy" not in st.session_state:
-        st.session_state.privacy_policy = False
-    if "form_submitted" not in st.session_state:
-        st.session_state.form_submitted = False
-
-    # Initialize the pet recommendations results list
-    if "pet_recommendations" not in st.session_state:
-        st.session_state.pet_recommendations = []
-
-    # Set the initial pet ID to 0
-    if "current_pet_id" not in st.session_state:
-        st.session_state.current_pet_id = 0
-
-    # Set the default number of recommendations to 10
-    if "number_of_recommendations" not in st.session_state:
-        st.session_state.number_of_recommendations = 10
-
-    # Set the initial state for navigation buttons
-    if "next_recommendation" not in st.session_state:
-        st.session_state.next_recommendation = False
-    if "previous_recommendation" not in st.session_state:
-        st.session_state.previous_recommendation = False
+    for key, default_value in SESSION_STATE_DEFAULTS.items():
+        st.session_state.setdefault(key, default_value)
 
 
 def show_title_and_description():
@@ -121,14 +155,14 @@ def show_questions_section():
 
     # Initialize with "1" as the default value for "urgent_adoption"
     client_answers = [1]
-    for question in QUESTIONS:
+    for label, options, option_values in QUESTIONS_CHOICES:
         answer = st.selectbox(
-            question["question"],
-            options=question["options"].keys(),
+            label,
+            options=options,
             index=None,
             placeholder="Selecciona una opción",
         )
-        client_answers.append(None if answer is None else question["options"][answer])
+        client_answers.append(None if answer is None else option_values[answer])
 
     st.session_state.client_answers = client_answers
 
@@ -169,12 +203,18 @@ def show_submit_button():
         "ENVIAR",
         use_container_width=True,
         type="primary",
-        on_click=lambda: st.session_state.update(
-            form_submitted=True,
-            next_recommendation=False,
-            previous_recommendation=False,
-            current_pet_id=0,
-        ),
+        on_click=reset_recommendations_navigation,
+    )
+
+
+def reset_recommendations_navigation():
+    """Go back to the first recommendation when the form is submitted."""
+
+    st.session_state.update(
+        form_submitted=True,
+        next_recommendation=False,
+        previous_recommendation=False,
+        current_pet_id=0,
     )
 
 
@@ -218,13 +258,24 @@ def check_form_submission() -> bool:
 def get_and_show_pet_recommendations():
     """Get and display the pet recommendations based on the client's answers."""
 
-    if not (
-        st.session_state.next_recommendation or st.session_state.previous_recommendation
-    ):
-        st.session_state.pet_recommendations = get_pet_recommendations(
-            st.session_state.client_answers,
+    # Only compute the recommendations again if the answers have changed, navigating
+    # between them or resubmitting the same form reuses the previous ones
+    client_answers = tuple(st.session_state.client_answers)
+    if st.session_state.recommended_client_answers != client_answers:
+        st.session_state.pet_recommendations = get_cached_pet_recommendations(
+            client_answers,
             st.session_state.number_of_recommendations,
         )
+        st.session_state.recommended_client_answers = client_answers
+
+        # Format the texts to display for each recommended pet only once, so navigating
+        # between them does not format them again
+        st.session_state.pet_recommendations_texts = [
+            format_pet_info(pet)
+            for pet in st.session_state.pet_recommendations.itertuples(
+                index=False, name="Pet"
+            )
+        ]
 
     st.write("---")
     show_navigation_section()
@@ -242,9 +293,56 @@ def get_and_show_pet_recommendations():
 
     # Display the selected recommended pet
     display_pet_info(
-        st.session_state.pet_recommendations[st.session_state.current_pet_id]
+        next(
+            st.session_state.pet_recommendations.iloc[
+                [st.session_state.current_pet_id]
+            ].itertuples(index=False, name="Pet")
+        ),
+        st.session_state.pet_recommendations_texts[st.session_state.current_pet_id],
+    )
+
+    # Let the browser download the images of the adjacent recommendations while the
+    # client reads the current one, so they are already cached when navigating to them
+    prefetch_adjacent_pet_images()
+
+
+@st.cache_data(show_spinner=False, max_entries=1000)
+def get_cached_pet_recommendations(
+    client_answers: tuple[float, ...],
+    number_of_recommendations: int,
+):
+    """
+    Get the pet recommendations for the given client answers with the models loaded by
+    this process, reusing them across sessions for the most recent distinct answers.
+    """
+
+    return get_pet_recommendations(list(client_answers), number_of_recommendations)
+
+
+def prefetch_adjacent_pet_images():
+    """Prefetch the images of the previous and next recommendations in the browser."""
+
+    adjacent_pet_ids = [
+        pet_id
+        for pet_id in (
+            st.session_state.current_pet_id - 1,
+            st.session_state.current_pet_id + 1,
+        )
+        if 0 <= pet_id < len(st.session_state.pet_recommendations)
+    ]
+    adjacent_img_urls = (
+        st.session_state.pet_recommendations["img_url"].iloc[adjacent_pet_ids].dropna()
     )
 
+    if not adjacent_img_urls.empty:
+        st.markdown(
+            "".join(
+                f'<img src="{escape(img_url)}" style="display: none;" alt="">'
+                for img_url in adjacent_img_urls
+            ),
+            unsafe_allow_html=True,
+        )
+
 
 def show_navigation_section():
     """Display navigation buttons for previous and next pet recommendations."""
@@ -261,11 +359,7 @@ def show_navigation_section():
             "Recomendación anterior",
             use_container_width=True,
             disabled=(st.session_state.current_pet_id <= 0),
-            on_click=lambda: st.session_state.update(
-                current_pet_id=st.session_state.current_pet_id - 1,
-                next_recommendation=False,
-                previous_recommendation=True,
-            ),
+            on_click=go_to_previous_recommendation,
         )
 
     with right:
@@ -276,143 +370,74 @@ def show_navigation_section():
                 st.session_state.current_pet_id
                 >= (len(st.session_state.pet_recommendations) - 1)
             ),
-            on_click=lambda: st.session_state.update(
-                current_pet_id=st.session_state.current_pet_id + 1,
-                next_recommendation=True,
-                previous_recommendation=False,
-            ),
+            on_click=go_to_next_recommendation,
         )
 
 
-def display_pet_info(pet):
-    """Display the information of the recommended pet."""
+def go_to_previous_recommendation():
+    """Move to the previous pet recommendation."""
+
+    st.session_state.update(
+        current_pet_id=st.session_state.current_pet_id - 1,
+        next_recommendation=False,
+        previous_recommendation=True,
+    )
+
+
+def go_to_next_recommendation():
+    """Move to the next pet recommendation."""
+
+    st.session_state.update(
+        current_pet_id=st.session_state.current_pet_id + 1,
+        next_recommendation=True,
+        previous_recommendation=False,
+    )
+
 
-    st.title(pet["name"])
+def display_pet_info(pet, pet_texts: dict[str, list[str]]):
+    """Display the information of the recommended pet and its formatted texts."""
+
+    st.title(pet.name)
     st.subheader(
         "🔴 Necesito hogar urgente, ¿me ayudas a encontrarlo?"
-        if pet["urgent_adoption"]
+        if pet.urgent_adoption
         else ""
     )
-    st.image(pet["img_url"], caption="", use_container_width=True)
+    st.image(pet.img_url, caption="", use_container_width=True)
 
     st.subheader("Descripción:")
-    if isinstance(pet["description_1"], str) and pet["description_1"].strip() != "":
-        st.write(pet["description_1"].strip())
+    if isinstance(pet.description_1, str) and pet.description_1.strip() != "":
+        st.write(pet.description_1.strip())
     if (
-        isinstance(pet["description_2"], str)
-        and pet["description_2"].strip() != ""
-        and pet["description_2"] != pet["description_1"]
+        isinstance(pet.description_2, str)
+        and pet.description_2.strip() != ""
+        and pet.description_2 != pet.description_1
     ):
-        st.write(pet["description_2"].strip())
+        st.write(pet.description_2.strip())
 
     left_col_1, right_col_1 = st.columns(2, border=True)
 
     with left_col_1:
         st.subheader("Características:")
-
-        st.write(
-            ("♂" if pet["gender"] == "Macho" else "♀") + f" Género: {pet["gender"]}"
-        )
-        st.write(f"🎂 Edad: {pet["age"]} años")
-        st.write(f"📏 Tamaño: {pet["size"]}")
-        st.write(f"🐾 Raza: {pet["breed"]}")
-        st.write(f"🌍 Provincia: {pet["province"]}")
-        st.write(f"🛩️ Puede viajar: {"Sí" if pet["can_travel"] else "No"}")
+        for text in pet_texts["characteristics"]:
+            st.write(text)
 
     with right_col_1:
         st.subheader("Salud y cuidados:")
-        st.write(
-            "🩺 "
-            + (
-                "Necesita cuidados veterinarios"
-                if pet["needs_vet_care"]
-                else "No necesita cuidados veterinarios especiales"
-            )
-        )
-        if pet["is_healthy"]:
-            st.write("💚 Está sano")
-        st.write(
-            "💉 " + ("Está vacunado" if pet["is_vaccinated"] else "No está vacunado")
-        )
-        st.write(
-            "🪱 "
-            + ("Está desparasitado" if pet["is_dewormed"] else "No está desparasitado")
-        )
-        st.write(
-            "✂️ "
-            + ("Está esterilizado" if pet["is_sterilized"] else "No está esterilizado")
-        )
-        st.write(
-            "🪪 "
-            + ("Está identificado" if pet["is_identified"] else "No está identificado")
-        )
-        st.write(
-            "📌 "
-            + ("Tiene microchip" if pet["has_microchip"] else "No tiene microchip")
-        )
-        st.write(
-            "🛂 " + ("Tiene pasaporte" if pet["has_passport"] else "No tiene pasaporte")
-        )
+        for text in pet_texts["health_and_care"]:
+            st.write(text)
 
     left_col_2, right_col_2 = st.columns(2, border=True)
 
     with left_col_2:
         st.subheader("Compatibilidades:")
-        st.write(
-            "👶 "
-            + (
-                "Compatible con niños"
-                if pet["good_with_children"]
-                else "No es compatible con niños"
-            )
-        )
-        st.write(
-            "🐱 "
-            + (
-                "Compatible con gatos"
-                if pet["good_with_cats"]
-                else "No es compatible con gatos"
-            )
-        )
-        st.write(
-            "🐶 "
-            + (
-                "Compatible con perros"
-                if pet["good_with_dogs"]
-                else "No es compatible con perros"
-            )
-        )
+        for text in pet_texts["compatibilities"]:
+            st.write(text)
 
     with right_col_2:
         st.subheader("Personalidad de la mascota:")
-        if any(
-            [
-                pet["is_affectionate"],
-                pet["is_hyperactive"],
-                pet["is_fearful"],
-                pet["is_sociable"],
-                pet["is_calm"],
-                pet["is_sedentary"],
-            ]
-        ):
-            if pet["is_affectionate"]:
-                st.write("❤️ Cariñoso")
-            if pet["is_hyperactive"]:
-                st.write("⚡ Hiperactivo")
-            if pet["is_fearful"]:
-                st.write("😨 Miedoso")
-            if pet["is_sociable"]:
-                st.write("👥 Sociable")
-            if pet["is_calm"]:
-                st.write("🛏️ Tranquilo")
-            if pet["is_sedentary"]:
-                st.write("🐢 Sedentario")
-
-        else:
-            st.write(
-                "No se han especificado características específicas para esta mascota,"
-                + " pero ello no quita que sea una gran opción para adoptar."
-            )
+        for text in pet_texts["personality"]:
+            st.write(text)
 
     st.write("---")
 
@@ -424,10 +449,50 @@ def display_pet_info(pet):
 
     st.link_button(
         "Ir a la web de adopción",
-        url=pet["info_url"],
+        url=pet.info_url,
         use_container_width=True,
     )
 
 
+def format_pet_info(pet) -> dict[str, list[str]]:
+    """Format the texts to display for each section of the information of a pet."""
+
+    pet_texts = {
+        "characteristics": [
+            ("♂" if pet.gender == "Macho" else "♀") + f" Género: {pet.gender}",
+            f"🎂 Edad: {pet.age} años",
+            f"📏 Tamaño: {pet.size}",
+            f"🐾 Raza: {pet.breed}",
+            f"🌍 Provincia: {pet.province}",
+            f"🛩️ Puede viajar: {"Sí" if pet.can_travel else "No"}",
+        ],
+        "health_and_care": format_boolean_features(pet, HEALTH_AND_CARE_TEXTS),
+        "compatibilities": format_boolean_features(pet, COMPATIBILITIES_TEXTS),
+        "personality": format_boolean_features(pet, PERSONALITY_TEXTS),
+    }
+
+    if not pet_texts["personality"]:
+        pet_texts["personality"].append(
+            "No se han especificado características específicas para esta mascota,"
+            + " pero ello no quita que sea una gran opción para adoptar."
+        )
+
+    return pet_texts
+
+
+def format_boolean_features(
+    pet, features_texts: dict[str, tuple[str, str | None]]
+) -> list[str]:
+    """Select the text to display for each boolean feature of a pet."""
+
+    texts = []
+    for feature, (true_text, false_text) in features_texts.items():
+        text = true_text if getattr(pet, feature) else false_text
+        if text is not None:
+            texts.append(text)
+
+    return texts
+
+
 if __name__ == "__main__":
     main()
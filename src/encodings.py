@@ -5,17 +5,17 @@ Mappings for Pet Adoption Recommendation System
 This module defines the mappings for pet attributes such as the pet gender, age, and size.
 """
 
-import numpy as np
+from types import MappingProxyType
 
 
 def invert_dict(d):
-    """Inverts a dictionary."""
-    inverted_dict = {v: (k if v is not None else "Desconocido") for k, v in d.items()}
+    """
+    Inverts a dictionary into a read-only mapping.
 
-    # Handle the case where the key is nan
-    inverted_dict[np.nan] = "Desconocido"
-
-    return inverted_dict
+    Unknown or missing values are not part of the inverted mapping, look them up with
+    `.get(value, "Desconocido")` instead.
+    """
+    return MappingProxyType({v: k for k, v in d.items() if v is not None})
 
 
 # Pet gender
@@ -8,11 +8,15 @@ recommendation system. It includes functions to load the models, preprocess inpu
 
 from pathlib import Path
 import pickle
+from typing import Callable, NamedTuple
 
+import numpy as np
 import pandas as pd
 from pandas.core.dtypes.common import is_bool_dtype
+from scipy.spatial.distance import euclidean
 from sklearn.preprocessing import MinMaxScaler
 from sklearn.neighbors import NearestNeighbors
+import streamlit as st
 import torch
 
 try:
@@ -31,36 +35,151 @@ except ImportError:
     )
 
 
-__knn_model = None
-__scaler_model = None
-__chars_means = None
-__dogs_df = None
-__dogs_train_df = None
+# Identifiers of the dogs considered outliers in the dataset
+DOGS_OUTLIERS_INDEX = frozenset(
+    {
+        2023,
+        8706,
+        11011,
+        11221,
+        11334,
+        12385,
+        12541,
+        12780,
+        13156,
+        13377,
+        13378,
+    }
+)
+
+# Types of the non-boolean features of the dataset of pets available for adoption
+DOGS_DATASET_DTYPES = {
+    "name": "category",
+    "breed": "category",
+    "gender": "category",
+    "age": np.float64,
+    "size": "category",
+    "province": "category",
+    "description_1": "category",
+    "description_2": "category",
+    "img_url": "category",
+    "info_url": "category",
+}
+
+# Weight of each client answer, by its position, in each of the desired pet features
+PET_FEATURES_ANSWERS_WEIGHTS = {
+    "age": {3: 0.6, 4: 0.4},
+    "is_male": {1: 1},
+    "size": {2: 0.3, 3: 0.3, 4: 0.3, 9: 0.1},
+    "can_travel": {0: 1},
+    "urgent_adoption": {0: 1},
+    "needs_vet_care": {4: 0.7, 9: 0.3},
+    "is_vaccinated": {5: 1},
+    "is_healthy": {4: 0.7, 9: 0.3},
+    "is_sterilized": {5: 1},
+    "has_passport": {5: 1},
+    "good_with_children": {8: 1},
+    "good_with_cats": {7: 1},
+    "good_with_dogs": {6: 1},
+    "is_hyperactive": {3: 0.4, 9: 0.6},
+    "is_fearful": {6: 0.3, 7: 0.3, 8: 0.3, 10: 0.1},
+    "is_sociable": {6: 0.1, 8: 0.15, 9: 0.4, 10: 0.35},
+    "is_calm": {3: 0.5, 9: 0.5},
+}
+PET_FEATURES_NAMES = tuple(PET_FEATURES_ANSWERS_WEIGHTS)
+
+# Matrix that converts the client answers, the urgent adoption default followed by the
+# answer to each form question, into the pet features in a single product
+NUMBER_OF_CLIENT_ANSWERS = 11
+PET_FEATURES_WEIGHTS_MATRIX = np.array(
+    [
+        [
+            answers_weights.get(answer_id, 0)
+            for answer_id in range(NUMBER_OF_CLIENT_ANSWERS)
+        ]
+        for answers_weights in PET_FEATURES_ANSWERS_WEIGHTS.values()
+    ],
+    dtype=np.float64,
+)
+
+# Encoded name and encoding of each categorical feature, and the other way around
+CATEGORICAL_FEATURES_ENCODINGS = {
+    "gender": ("is_male", PET_GENDER_ENCODING),
+    "size": ("size", PET_SIZE_ENCODING),
+}
+CATEGORICAL_FEATURES_DECODINGS = {
+    "is_male": ("gender", INV_PET_GENDER_ENCODING),
+    "size": ("size", INV_PET_SIZE_ENCODING),
+}
+
+
+class NNModels(NamedTuple):
+    """Set of models and datasets used together to get pet recommendations."""
+
+    knn_model: NearestNeighbors
+    scaler_model: MinMaxScaler
+    chars_means: pd.Series
+    features_encoders: dict[str, tuple[str, Callable]]
+    features_decoders: dict[str, tuple[str, Callable]]
+    dogs_df: pd.DataFrame
+    dogs_train_df: pd.DataFrame
+
+
+# Models currently in use, replaced as a whole so they are never read half updated
+__nn_models = None
 
 
 def setup_nn_models(
     knn_model_path: Path = Path("./models/knn_dog_adoption-2025-07-01_18-10-09.pkl"),
     dogs_df_path: Path = Path("./data/kiwoko_dogs_data-2025-06-27_12-56-43.csv"),
 ):
-    """Set up the neural network models for the application."""
+    """
+    Set up the neural network models for the application.
+
+    The models are only loaded and retrained the first time, later calls reuse them.
+    """
 
-    global __knn_model
-    global __scaler_model
-    global __chars_means
-    global __dogs_df
-    global __dogs_train_df
+    global __nn_models
+
+    __nn_models = load_nn_models(knn_model_path, dogs_df_path)
+
+
+@st.cache_resource(show_spinner=False)
+def load_nn_models(
+    knn_model_path: Path,
+    dogs_df_path: Path,
+) -> NNModels:
+    """
+    Load the neural network models and the dataset of pets currently available for
+    adoption, and retrain the models with it.
+
+    The result is shared across reruns and sessions, so this only happens once per
+    process.
+    """
 
     # Load the pre-trained KNN model
-    __knn_model = load_model(knn_model_path)
-    assert isinstance(__knn_model, NearestNeighbors)
+    knn_model = load_model(knn_model_path)
+    assert isinstance(knn_model, NearestNeighbors)
 
     # Load the dataset of pets currently available for adoption
-    __dogs_df = load_dataset(dogs_df_path)
-    assert isinstance(__dogs_df, pd.DataFrame)
+    dogs_df = load_dataset(dogs_df_path)
+    assert isinstance(dogs_df, pd.DataFrame)
 
     # Update knn model with the dataset of pets currently available for adoption
-    __dogs_train_df, __scaler_model, __chars_means = retrain_knn_model(
-        __knn_model, __dogs_df
+    dogs_train_df, scaler_model, chars_means = retrain_knn_model(knn_model, dogs_df)
+
+    # Build the encoder and decoder of each feature of the dataset once
+    features_encoders = build_features_encoders(dogs_df)
+    features_decoders = build_features_decoders(dogs_df)
+
+    return NNModels(
+        knn_model,
+        scaler_model,
+        chars_means,
+        features_encoders,
+        features_decoders,
+        dogs_df,
+        dogs_train_df,
     )
 
 
@@ -86,18 +205,41 @@ def load_model(model_path):
     return model
 
 
+@st.cache_data(show_spinner=False)
 def load_dataset(file_path: Path) -> pd.DataFrame:
-    """Load the dataset of pets currently available for adoption."""
+    """
+    Load the dataset of pets currently available for adoption.
 
-    df = pd.read_csv(file_path, index_col=0)
+    The result is cached across sessions, so the CSV file is only parsed once per
+    process.
+    """
 
-    for feature in df.columns:
-        if df[feature].dtype.name == "object":
-            df[feature] = df[feature].astype("category")  # Convert boolean to int
+    # Parse the text features directly as categories, boolean features are inferred as
+    # single bytes
+    df = pd.read_csv(file_path, index_col=0, dtype=DOGS_DATASET_DTYPES)
 
     return df
 
 
+@st.cache_data(show_spinner=False)
+def get_clean_dogs_df(
+    file_path: Path = Path("./data/kiwoko_dogs_data-2025-06-27_12-56-43.csv"),
+) -> pd.DataFrame:
+    """
+    Load the dataset of pets currently available for adoption without the entries that
+    lack a size or an image, nor the known outliers, for display purposes.
+    """
+
+    dogs_df = load_dataset(file_path)
+
+    # Filter all the unwanted entries with a single boolean mask
+    return dogs_df.loc[
+        dogs_df["size"].notna()
+        & dogs_df["img_url"].notna()
+        & ~dogs_df.index.isin(DOGS_OUTLIERS_INDEX)
+    ]
+
+
 def retrain_knn_model(
     knn_model: NearestNeighbors = None,
     dogs_df: pd.DataFrame = None,
@@ -110,21 +252,40 @@ def retrain_knn_model(
     new ones.
     """
 
+    # Read the models currently in use only once, so all of them belong to the same set
+    global __nn_models
+    nn_models = __nn_models
+
     if knn_model is None:
-        global __knn_model
-        assert isinstance(__knn_model, NearestNeighbors)
-        knn_model = __knn_model
+        assert isinstance(nn_models, NNModels)
+        knn_model = nn_models.knn_model
 
     if dogs_df is None:
-        global __dogs_df
-        assert isinstance(__dogs_df, pd.DataFrame)
-        dogs_df = __dogs_df
+        assert isinstance(nn_models, NNModels)
+        dogs_df = nn_models.dogs_df
 
     # Preprocess the training data
     dogs_train_df, scaler_model, chars_means = preprocess_train_data(dogs_df)
 
-    # Fit the KNN model with the preprocessed data
-    knn_model.fit(dogs_train_df)
+    # Replace the SciPy euclidean distance function, which is called from Python for
+    # every pair of samples, with the equivalent built-in weighted minkowski metric, which
+    # computes all the pairwise distances at once in compiled code
+    if knn_model.get_params()["metric"] is euclidean:
+        knn_model.set_params(metric="minkowski", p=2)
+
+    # Index the dataset in a ball tree once at fit time, so that each query only visits
+    # the nearby pets instead of computing the distances to all of them
+    knn_model.set_params(algorithm="ball_tree", leaf_size=40)
+
+    # Fitting on a plain matrix skips the scikit-learn feature names check, so ensure the
+    # columns are in the same order as the features of the queries
+    assert (
+        tuple(dogs_train_df.columns) == PET_FEATURES_NAMES
+    ), "The training features must match PET_FEATURES_NAMES in name and order"
+
+    # Fit the KNN model with the preprocessed data, as a plain matrix since the queries
+    # are plain matrices too
+    knn_model.fit(dogs_train_df.to_numpy())
 
     return dogs_train_df, scaler_model, chars_means
 
@@ -139,14 +300,9 @@ def preprocess_train_data(
     """
 
     if dogs_df is None:
-        global __dogs_df
-        assert isinstance(__dogs_df, pd.DataFrame)
-        dogs_df = __dogs_df
-
-    # Set categorical columns to 'category' dtype
-    for feature in dogs_df.columns:
-        if dogs_df[feature].dtype.name == "object":
-            dogs_df[feature] = dogs_df[feature].astype("category")
+        global __nn_models
+        assert isinstance(__nn_models, NNModels)
+        dogs_df = __nn_models.dogs_df
 
     # Drop nan values, unnecessary columns from the dataset and some outliers
     dogs_filtered_df = (
@@ -172,44 +328,42 @@ def preprocess_train_data(
             ]
         )
         .drop(
-            index=[
-                2023,
-                8706,
-                11011,
-                11221,
-                11334,
-                12385,
-                12541,
-                12780,
-                13156,
-                13377,
-                13378,
-            ],
+            index=DOGS_OUTLIERS_INDEX,
             errors="ignore",
         )
     )
 
-    # Encode categorical and boolean features, leave numerical features as is
-    dogs_encoded_df = dogs_filtered_df.select_dtypes(include="number")
-
-    dogs_encoded_df["is_male"] = (
-        dogs_filtered_df["gender"].map(PET_GENDER_ENCODING).astype(int)
-    )
-    dogs_encoded_df["size"] = (
-        dogs_filtered_df["size"].map(PET_SIZE_ENCODING).astype(int)
+    # Encode categorical and boolean features, leave numerical features as is, building
+    # the encoded dataset in a single concatenation. The categorical features are encoded
+    # with the codes of their categories, which follow the order of their encodings
+    dogs_scaled_df = pd.concat(
+        [
+            dogs_filtered_df.select_dtypes(include="number"),
+            pd.DataFrame(
+                {
+                    "is_male": pd.Categorical(
+                        dogs_filtered_df["gender"],
+                        categories=list(PET_GENDER_ENCODING),
+                    ).codes,
+                    "size": pd.Categorical(
+                        dogs_filtered_df["size"],
+                        categories=list(PET_SIZE_ENCODING),
+                    ).codes,
+                },
+                index=dogs_filtered_df.index,
+            ),
+            dogs_filtered_df.select_dtypes(include="boolean").astype(np.int8),
+        ],
+        axis=1,
     )
 
-    for feature in dogs_filtered_df.select_dtypes(include="boolean").columns:
-        dogs_encoded_df[feature] = dogs_filtered_df[feature].astype(int)
-
     # Scale the numerical features
     scaler_model = MinMaxScaler(
         feature_range=(0, 1),
     )
 
-    dogs_scaled_df = dogs_encoded_df.copy()
     dogs_scaled_df[["age", "size"]] = scaler_model.fit_transform(
-        dogs_scaled_df[["age", "size"]]
+        dogs_scaled_df[["age", "size"]].astype(np.float64)
     )
 
     # Calculate the means of the features for later use
@@ -224,23 +378,24 @@ def get_pet_recommendations(
     knn_model: NearestNeighbors = None,
     dogs_df: pd.DataFrame = None,
     dogs_train_df: pd.DataFrame = None,
-) -> list[pd.DataFrame]:
+) -> pd.DataFrame:
     """Get pet recommendations based on the given input data using a KNN model."""
 
+    # Read the models currently in use only once, so all of them belong to the same set
+    global __nn_models
+    nn_models = __nn_models
+
     if knn_model is None:
-        global __knn_model
-        assert isinstance(__knn_model, NearestNeighbors)
-        knn_model = __knn_model
+        assert isinstance(nn_models, NNModels)
+        knn_model = nn_models.knn_model
 
     if dogs_df is None:
-        global __dogs_df
-        assert isinstance(__dogs_df, pd.DataFrame)
-        dogs_df = __dogs_df
+        assert isinstance(nn_models, NNModels)
+        dogs_df = nn_models.dogs_df
 
     if dogs_train_df is None:
-        global __dogs_train_df
-        assert isinstance(__dogs_train_df, pd.DataFrame)
-        dogs_train_df = __dogs_train_df
+        assert isinstance(nn_models, NNModels)
+        dogs_train_df = nn_models.dogs_train_df
 
     # Convert the client answers into the desired pet features
     pet_desired_features = client_answers_to_pet_features(client_answers)
@@ -249,14 +404,14 @@ def get_pet_recommendations(
     preprocessed_input_data = preprocess_input_data(pet_desired_features)
 
     # Get recommendations using the KNN model
-    pet_recommendations = [
-        dogs_df.loc[dogs_train_df.iloc[recommendation_id].name]
-        for recommendation_id in knn_model.kneighbors(
-            preprocessed_input_data,
-            n_neighbors=number_of_recommendations,
-            return_distance=False,
-        )[0]
-    ]
+    recommendations_ids = knn_model.kneighbors(
+        preprocessed_input_data,
+        n_neighbors=number_of_recommendations,
+        return_distance=False,
+    )[0]
+
+    # Gather all the recommended pets at once, keeping their features column-wise
+    pet_recommendations = dogs_df.loc[dogs_train_df.index[recommendations_ids]]
 
     return pet_recommendations
 
@@ -267,121 +422,132 @@ def client_answers_to_pet_features(client_answers: list[float]) -> pd.Series:
     system.
     """
 
-    # Map the client input data to the pet features
+    # Map the client input data to the pet features with a single matrix product
     pet_features = pd.Series(
-        {
-            "age": ((client_answers[3] * 0.6) + (client_answers[4] * 0.4)),
-            "is_male": client_answers[1],
-            "size": (
-                (client_answers[2] * 0.3)
-                + (client_answers[3] * 0.3)
-                + (client_answers[4] * 0.3)
-                + (client_answers[9] * 0.1)
-            ),
-            "can_travel": client_answers[0],
-            "urgent_adoption": client_answers[0],
-            "needs_vet_care": ((client_answers[4] * 0.7) + (client_answers[9] * 0.3)),
-            "is_vaccinated": client_answers[5],
-            "is_healthy": ((client_answers[4] * 0.7) + (client_answers[9] * 0.3)),
-            "is_sterilized": client_answers[5],
-            "has_passport": client_answers[5],
-            "good_with_children": client_answers[8],
-            "good_with_cats": client_answers[7],
-            "good_with_dogs": client_answers[6],
-            "is_hyperactive": ((client_answers[3] * 0.4) + (client_answers[9] * 0.6)),
-            "is_fearful": (
-                (client_answers[6] * 0.3)
-                + (client_answers[7] * 0.3)
-                + (client_answers[8] * 0.3)
-                + (client_answers[10] * 0.1)
-            ),
-            "is_sociable": (
-                (client_answers[6] * 0.1)
-                + (client_answers[8] * 0.15)
-                + (client_answers[9] * 0.4)
-                + (client_answers[10] * 0.35)
-            ),
-            "is_calm": ((client_answers[3] * 0.5) + (client_answers[9] * 0.5)),
-        }
+        PET_FEATURES_WEIGHTS_MATRIX @ np.asarray(client_answers, dtype=np.float64),
+        index=PET_FEATURES_NAMES,
     )
 
     return pet_features
 
 
-def preprocess_input_data(input_data: pd.Series) -> pd.DataFrame:
-    """Preprocess the input data for the machine learning models."""
+def preprocess_input_data(input_data: pd.Series) -> np.ndarray:
+    """
+    Preprocess the input data for the machine learning models.
 
-    # Reshape the input to match the expected format for the KNN model
-    preprocessed_input_data = pd.DataFrame(
-        input_data.values.reshape(1, -1),
-        columns=input_data.index,
-    )
+    The features of the input data must be in the same order as the training data.
+    """
+
+    # Reshape the input to match the expected format for the KNN model, a single row
+    # matrix that scikit-learn can use without copying it again
+    preprocessed_input_data = np.ascontiguousarray(
+        input_data, dtype=np.float64
+    ).reshape(1, -1)
 
     return preprocessed_input_data
 
 
-def encode_non_numeric_features(
-    input_data: pd.Series,
-    dogs_df: pd.DataFrame = None,
-) -> pd.Series:
-    """Encode the client input data for the machine learning models."""
+def build_features_encoders(
+    dogs_df: pd.DataFrame,
+) -> dict[str, tuple[str, Callable]]:
+    """
+    Build the encoded name and the encoder of each feature of the given dataset, used to
+    encode the client input data.
+    """
 
-    if dogs_df is None:
-        global __dogs_df
-        assert isinstance(__dogs_df, pd.DataFrame)
-        dogs_df = __dogs_df
+    features_encoders = {}
+    for feature, dtype in dogs_df.dtypes.items():
 
-    encoded_input = pd.Series(dtype=float)
-    for feature in input_data.index:
+        # Convert boolean values to integers (0 or 1)
+        if is_bool_dtype(dtype):
+            features_encoders[feature] = (feature, lambda value: int(bool(value)))
 
-        # Encode categorical features to numerical values
-        if feature == "gender":
-            encoded_input["is_male"] = PET_GENDER_ENCODING[input_data[feature]]
+        # For numerical features, we can leave them the same
+        else:
+            features_encoders[feature] = (feature, lambda value: value)
 
-        elif feature == "size":
-            encoded_input[feature] = PET_SIZE_ENCODING[input_data[feature]]
+    # Encode categorical features to numerical values
+    for feature, (encoded_feature, encoding) in CATEGORICAL_FEATURES_ENCODINGS.items():
+        features_encoders[feature] = (encoded_feature, encoding.__getitem__)
 
-        # Convert boolean values to integers (0 or 1)
-        elif is_bool_dtype(dogs_df[feature].dtype):
-            encoded_input[feature] = int(bool(input_data[feature]))
+    return features_encoders
 
-        # For numerical features, we can leave them the same
+
+def build_features_decoders(
+    dogs_df: pd.DataFrame,
+) -> dict[str, tuple[str, Callable]]:
+    """
+    Build the decoded name and the decoder of each encoded feature of the given dataset,
+    used to decode the client input data.
+    """
+
+    features_decoders = {}
+    for feature, dtype in dogs_df.dtypes.items():
+
+        # Decode boolean values back to their original boolean representation
+        if is_bool_dtype(dtype):
+            features_decoders[feature] = (feature, lambda value: bool(round(value)))
+
+        # For numerical features, we can leave them as is
         else:
-            encoded_input[feature] = input_data[feature]
+            features_decoders[feature] = (feature, lambda value: value)
 
-    return encoded_input
+    # Decode categorical features back to their original values
+    for feature, (decoded_feature, decoding) in CATEGORICAL_FEATURES_DECODINGS.items():
+        features_decoders[feature] = (
+            decoded_feature,
+            lambda value, decoding=decoding: decoding.get(value, "Desconocido"),
+        )
 
+    return features_decoders
 
-def decode_non_numeric_features(
+
+def encode_non_numeric_features(
     input_data: pd.Series,
     dogs_df: pd.DataFrame = None,
 ) -> pd.Series:
-    """Decode the client input data back to its original categorical values."""
+    """Encode the client input data for the machine learning models."""
 
     if dogs_df is None:
-        global __dogs_df
-        assert isinstance(__dogs_df, pd.DataFrame)
-        dogs_df = __dogs_df
+        global __nn_models
+        assert isinstance(__nn_models, NNModels)
+        features_encoders = __nn_models.features_encoders
+    else:
+        features_encoders = build_features_encoders(dogs_df)
 
-    decoded_input = pd.Series(dtype=object)
-    for feature in input_data.index:
+    encoders = map(features_encoders.__getitem__, input_data.index)
 
-        # Decode categorical features back to their original values
-        if feature == "is_male":
-            decoded_input["gender"] = INV_PET_GENDER_ENCODING[input_data[feature]]
+    return pd.Series(
+        {
+            encoded_feature: encode(value)
+            for (encoded_feature, encode), value in zip(encoders, input_data)
+        },
+        dtype=float,
+    )
 
-        elif feature == "size":
-            decoded_input[feature] = INV_PET_SIZE_ENCODING[input_data[feature]]
 
-        # Decode boolean values back to their original boolean representation
-        elif is_bool_dtype(dogs_df[feature].dtype):
-            decoded_input[feature] = bool(round(input_data[feature]))
+def decode_non_numeric_features(
+    input_data: pd.Series,
+    dogs_df: pd.DataFrame = None,
+) -> pd.Series:
+    """Decode the client input data back to its original categorical values."""
 
-        # For numerical features, we can leave them as is
-        else:
-            decoded_input[feature] = input_data[feature]
+    if dogs_df is None:
+        global __nn_models
+        assert isinstance(__nn_models, NNModels)
+        features_decoders = __nn_models.features_decoders
+    else:
+        features_decoders = build_features_decoders(dogs_df)
+
+    decoders = map(features_decoders.__getitem__, input_data.index)
 
-    return decoded_input
+    return pd.Series(
+        {
+            decoded_feature: decode(value)
+            for (decoded_feature, decode), value in zip(decoders, input_data)
+        },
+        dtype=object,
+    )
 
 
 def fill_features_with_means(
@@ -391,14 +557,14 @@ def fill_features_with_means(
     """Fill missing values in the client input data with the mean of each feature."""
 
     if chars_means is None:
-        global __chars_means
-        assert isinstance(__chars_means, pd.Series)
-        chars_means = __chars_means
+        global __nn_models
+        assert isinstance(__nn_models, NNModels)
+        chars_means = __nn_models.chars_means
 
     mean_filled_input = chars_means.copy()
 
-    for feature in input_data.index:
-        mean_filled_input[feature] = input_data[feature]
+    # Overwrite the means of all the features given in the input data at once
+    mean_filled_input.loc[input_data.index] = input_data.to_numpy(dtype=np.float64)
 
     return mean_filled_input
 
@@ -410,21 +576,20 @@ def scale_numerical_features(
     """Scale the numerical features of the client input data using a pre-trained scaler model."""
 
     if scaler_model is None:
-        global __scaler_model
-        assert isinstance(__scaler_model, MinMaxScaler)
-        scaler_model = __scaler_model
+        global __nn_models
+        assert isinstance(__nn_models, NNModels)
+        scaler_model = __nn_models.scaler_model
 
     scaled_input = input_data.copy()
 
-    input_data_df = pd.DataFrame(
-        scaled_input.values.reshape(1, -1),
-        columns=input_data.index,
+    # Apply the min-max scaling directly, the same way the scaler does it, instead of
+    # going through a single row DataFrame and the input validation of the scaler
+    scaled_features = scaler_model.feature_names_in_
+    scaled_input[scaled_features] = (
+        input_data[scaled_features].to_numpy(dtype=np.float64) * scaler_model.scale_
+        + scaler_model.min_
     )
 
-    scaled_input[scaler_model.get_feature_names_out()] = scaler_model.transform(
-        input_data_df[scaler_model.get_feature_names_out()]
-    )[0]
-
     return scaled_input
 
 
@@ -435,21 +600,17 @@ def unscale_numerical_features(
     """Unscale the numerical features of the client input data using a pre-trained scaler model."""
 
     if scaler_model is None:
-        global __scaler_model
-        assert isinstance(__scaler_model, MinMaxScaler)
-        scaler_model = __scaler_model
+        global __nn_models
+        assert isinstance(__nn_models, NNModels)
+        scaler_model = __nn_models.scaler_model
 
     unscaled_input = input_data.copy()
 
-    input_data_df = pd.DataFrame(
-        unscaled_input.values.reshape(1, -1),
-        columns=input_data.index,
-    )
-
-    unscaled_input[scaler_model.get_feature_names_out()] = (
-        scaler_model.inverse_transform(
-            input_data_df[scaler_model.get_feature_names_out()]
-        )[0]
-    )
+    # Undo the min-max scaling directly, the same way the scaler does it, instead of
+    # going through a single row DataFrame and the input validation of the scaler
+    scaled_features = scaler_model.feature_names_in_
+    unscaled_input[scaled_features] = (
+        input_data[scaled_features].to_numpy(dtype=np.float64) - scaler_model.min_
+    ) / scaler_model.scale_
 
     return unscaled_input
@@ -34,21 +34,45 @@ class VAE(nn.Module):
         self.latent_dim = latent_dim
         self.hidden_dim = hidden_dim
 
-        # Encoder layers
+        # Encoder layers, the mean and log variance of the latent are computed together
         self.fc1 = nn.Linear(input_dim, hidden_dim)
-        self.fc_mu = nn.Linear(hidden_dim, latent_dim)  # mean of latent
-        self.fc_log_var = nn.Linear(hidden_dim, latent_dim)  # log variance of latent
+        self.fc_latent = nn.Linear(hidden_dim, 2 * latent_dim)  # mean and log variance
 
         # Decoder layers
         self.fc2 = nn.Linear(latent_dim, hidden_dim)
         self.fc3 = nn.Linear(hidden_dim, input_dim)
 
+    def __setstate__(self, state):
+        """
+        Restore a pickled model, merging the separate mean and log variance layers of the
+        models saved before they were fused into a single layer.
+        """
+
+        super(VAE, self).__setstate__(state)
+
+        if "fc_mu" in self._modules:
+            fc_mu = self._modules.pop("fc_mu")
+            fc_log_var = self._modules.pop("fc_log_var")
+
+            self.fc_latent = nn.Linear(
+                self.hidden_dim,
+                2 * self.latent_dim,
+                device=fc_mu.weight.device,
+                dtype=fc_mu.weight.dtype,
+            )
+            with torch.no_grad():
+                self.fc_latent.weight.copy_(
+                    torch.cat([fc_mu.weight, fc_log_var.weight], dim=0)
+                )
+                self.fc_latent.bias.copy_(
+                    torch.cat([fc_mu.bias, fc_log_var.bias], dim=0)
+                )
+
     def encode(self, input_data):
         """Encode the input into a latent representation"""
 
         h = nn.functional.relu(self.fc1(input_data))
-        mu = self.fc_mu(h)
-        log_var = self.fc_log_var(h)
+        mu, log_var = self.fc_latent(h).chunk(2, dim=-1)
 
         return mu, log_var
 
@@ -92,9 +116,10 @@ class VAE(nn.Module):
     def train_vae(self, data_loader, num_epochs=10, learning_rate=1e-3, verbose=True):
         """Function to train the VAE model"""
 
-        # Define the optimizer parameters
+        # Define the optimizer parameters, updating all of them at once with the fused
+        # implementation of the optimizer, available on both CPU and GPU
         optimizer = torch.optim.Adam(
-            self.parameters(), lr=learning_rate, weight_decay=1e-5
+            self.parameters(), lr=learning_rate, weight_decay=1e-5, fused=True
         )
 
         # Ensure the model is in training mode
@@ -111,10 +136,11 @@ class VAE(nn.Module):
                 loss = self.vae_loss(recon_batch, batch, mu, log_var)
                 loss.backward()
                 optimizer.step()
-                current_epoch_total_loss += loss.item()
+                # Accumulate the loss on its device, without waiting for each batch
+                current_epoch_total_loss += loss.detach()
 
-            # Store the loss for the current epoch
-            history[epoch] = current_epoch_total_loss / len(data_loader.dataset)
+            # Store the loss for the current epoch, reading it back only once per epoch
+            history[epoch] = float(current_epoch_total_loss) / len(data_loader.dataset)
 
             if verbose:
                 print(f"Epoch {epoch + 1}, Loss: {history[epoch]:.4f}")
@@ -124,9 +150,11 @@ class VAE(nn.Module):
     def impute_missing_values(self, input_data):
         """
         Evaluate the VAE model on the given input tensor data to get the reconstructed
-        output.
+        output, decoding the mean of the latent distribution so the imputation is
+        deterministic.
         Args:
-            input_data (torch.Tensor): Input tensor data to be evaluated.
+            input_data (torch.Tensor): Input tensor data to be evaluated, a single input
+                or a batch of them.
         Returns:
             torch.Tensor: Reconstructed output tensor from the VAE.
         """
@@ -134,15 +162,13 @@ class VAE(nn.Module):
         self.eval()
 
         # Ensure the input data is on the correct device
-        input_data = input_data.to(self.device)
+        input_data = input_data.to(self.device, non_blocking=True)
 
-        # Generate latent representation for the client input
-        with torch.no_grad():
-            mu, log_var = self.encode(input_data)
-            z = self.reparameterize(mu, log_var)
+        with torch.inference_mode():
+            # Generate latent representation for the client input
+            mu, _ = self.encode(input_data)
 
-        # Decode the latent representation to get the reconstructed dog features
-        with torch.no_grad():
-            reconstructed_dog = self.decode(z)
+            # Decode the latent representation to get the reconstructed dog features
+            reconstructed_dog = self.decode(mu)
 
         return reconstructed_dog